@@ -45,7 +45,23 @@ To execute the snippet:
 **Step 2:** The snippet itself may be run from the command line as follows:
 
 ```
-% python pybamocs_tutorial.py
+% python pybamocs_six_box_tutorial.py
+```
+
+To time the model without any plotting (e.g., when benchmarking), pass `--no-plot`. A specific Matplotlib backend
+may be selected with `--backend`, e.g., `--backend Agg` to run without opening any plot windows. To keep the outputs
+of the Fwn_A sweep at the end of the tutorial, pass `--save PATH` to write them to a compressed NumPy archive:
+
+```
+% python pybamocs_six_box_tutorial.py --save six_box_sweep.npz
+```
+
+The archive may then be reloaded for analysis with NumPy, e.g.,
+
+```
+sweep = np.load("six_box_sweep.npz")
+sweep["Fwn_A"]  # The simulated Fwn_A values
+sweep["M_n_A"]  # M_n_A for each run, with shape (number of Fwn_A values, number of time steps)
 ```
 
 We encourage the interested user to examine the code below to identify the relevant objects and methods required to
@@ -57,9 +73,12 @@ implement their specific use case.
 # IMPORT STATEMENTS
 # .............................................
 
+import argparse
+import builtins
 import time
+import numpy as np
 from matplotlib import pyplot as plt
-from typing import Union
+from typing import Optional, Sequence, Union
 
 # Import the `six_box_model` function and its arguments
 from pybamocs.six_box_model.six_box_model import six_box_model
@@ -72,6 +91,14 @@ from pybamocs.six_box_model.six_box_model_args import (
     SixBoxModelRandomization
 )
 
+# Box indices and labels in the order they are laid out on the 2x3 plot grids
+BOX_IDX = np.array([NORTH_A_IDX, NORTH_P_IDX, SOUTH_IDX, LOW_A_IDX, LOW_PI_IDX, DEEP_IDX])
+BOX_LABELS = ['North_A', 'North_P', 'South', 'Low_A', 'Low_PI', 'Deep']
+
+# Names of the outputs returned by `SixBoxModelResult.unpack()`, in order
+RESULT_NAMES = ['M_n_A', 'M_n_P', 'M_upw_A', 'M_upw_PI', 'M_eddy_A', 'M_eddy_PI', 'M_ex', 'D_low_A', 'D_low_PI', 'T', 'S',
+                'sigma_0']
+
 
 # Convenience function
 def print_six_box_model_argument_settings(argument: Union[SixBoxModelBoxDimensions,
@@ -94,7 +121,80 @@ def print_six_box_model_argument_settings(argument: Union[SixBoxModelBoxDimensio
     print()
 
 
-def main():
+def save_sweep_results(path: str, Fwn_A_values: Sequence[float], results: Sequence) -> str:
+    """
+    Save the outputs of a parameter sweep to a compressed NumPy `.npz` archive. Each output is stacked along a new
+    leading axis with one entry per sweep value, e.g., `M_n_A` has shape (len(Fwn_A_values), n_steps).
+    The archive can be read back with `np.load(path)`.
+    :param path: File to write. The `.npz` extension is added if it is missing.
+    :param Fwn_A_values: The Fwn_A values that were simulated, stored as `Fwn_A`.
+    :param results: One SixBoxModelResult per Fwn_A value, in the same order as `Fwn_A_values`.
+    :return: The path of the file that was written.
+    """
+    # np.savez_compressed appends the extension itself when it is missing; add it here so the returned path matches
+    if not path.endswith(".npz"):
+        path += ".npz"
+    unpacked = [result.unpack() for result in results]
+    outputs = {name: np.stack([np.asarray(value) for value in values])
+               for name, values in zip(RESULT_NAMES, zip(*unpacked))}
+    np.savez_compressed(path, Fwn_A=np.asarray(Fwn_A_values), **outputs)
+    return path
+
+
+def plot_six_boxes(values: np.ndarray, title: str) -> None:
+    """
+    Plot a per-box result (e.g., T, S, or sigma_0) on a new 2x3 grid with one box per subplot.
+    :param values: Array indexed by box along its first axis and by time along its second.
+    :param title: Title for the figure.
+    """
+    # All boxes share the same time axis, so let Matplotlib share the x limits and ticks across the grid
+    fig, ax = plt.subplots(nrows=2, ncols=3, sharex=True)
+    for axis, label, row in zip(ax.ravel(), BOX_LABELS, values[BOX_IDX]):
+        axis.plot(row)
+        axis.set_title(label)
+    fig.suptitle(title)
+    fig.tight_layout()
+
+
+def plot_results(M_n_A: np.ndarray, M_n_P: np.ndarray, M_upw_A: np.ndarray, M_upw_PI: np.ndarray,
+                 M_eddy_A: np.ndarray, M_eddy_PI: np.ndarray, D_low_A: np.ndarray, D_low_PI: np.ndarray,
+                 T: np.ndarray, S: np.ndarray, sigma_0: np.ndarray) -> None:
+    """
+    Plot the outputs of a single six-box model run: the transports and low-latitude depths on one figure, then the
+    temperature, salinity, and density of each box on one 2x3 grid each. The figures are shown without blocking.
+    """
+    print("Plotting results...")
+    series = {
+        'M_n_A': M_n_A,
+        'M_n_P': M_n_P,
+        'M_upw_A': M_upw_A,
+        'M_upw_PI': M_upw_PI,
+        'M_eddy_A': M_eddy_A,
+        'M_eddy_PI': M_eddy_PI,
+        'Dlow_A': D_low_A,
+        'D_low_PI': D_low_PI,
+    }
+    for label, values in series.items():
+        plt.plot(values, label=label)
+    plt.legend()
+    plt.title("1D Box Model Outputs")
+
+    plot_six_boxes(T, "Temperature in the 6 different boxes")
+    plot_six_boxes(S, "Salinity in the 6 different boxes")
+    plot_six_boxes(sigma_0, "Density in the 6 different boxes")
+    plt.show(block=False)
+
+
+def main(no_plot: bool = False, backend: Optional[str] = None, save_path: Optional[str] = None):
+    """
+    Run the tutorial.
+    :param no_plot: Skip all plotting, e.g., when benchmarking the model.
+    :param backend: Matplotlib backend to use, e.g., 'Agg'. The default backend is used if None.
+    :param save_path: If given, save the outputs of the Fwn_A sweep to this `.npz` file.
+    """
+    if backend:
+        plt.switch_backend(backend)
+
     print("Box model settings are divided into five groups:")
     # Each object represents a set of parameters to the model
     six_box_model_dimensions = SixBoxModelBoxDimensions()
@@ -126,13 +226,14 @@ def main():
 
     # To run the box model, simply call the `six_box_model` function with your argument objects
     print("Running the box model...")
-    start = time.time()
+    start = time.perf_counter_ns()
     results = six_box_model(six_box_model_dimensions,
                             six_box_model_initial_conditions,
                             six_box_model_parameters,
                             six_box_model_time_settings,
                             six_box_model_randomization)
-    print(f"Run complete. Time: {time.time() - start} seconds.")
+    run_time_ns = time.perf_counter_ns() - start
+    print(f"Run complete. Time: {run_time_ns / 1e9:.3f} seconds.")
 
     # Note that the results are contained in a SixBoxModelResult object
     print("Box model output object:")
@@ -159,73 +260,13 @@ def main():
     print("M_ex:", M_ex[:3])
     print("D_low_A:", D_low_A[:3])
     print("D_low_PI:", D_low_PI[:3])
-    print("T_north_A:", T[NORTH_A_IDX, :3])
-    print("T_north_P:", T[NORTH_P_IDX, :3])
-    print("T_south:", T[SOUTH_IDX, :3])
-    print("T_low_A:", T[LOW_A_IDX, :3])
-    print("T_low_PI:", T[LOW_PI_IDX, :3])
-    print("T_deep:", T[DEEP_IDX, :3])
-    print("S_north_A:", S[NORTH_A_IDX, :3])
-    print("S_north_P:", S[NORTH_P_IDX, :3])
-    print("S_south:", S[SOUTH_IDX, :3])
-    print("S_low_A:", S[LOW_A_IDX, :3])
-    print("S_low_PI:", S[LOW_PI_IDX, :3])
-    print("S_deep:", S[DEEP_IDX, :3])
-    print("sigma_0_north_A:", sigma_0[NORTH_A_IDX, :3])
-    print("sigma_0_north_P:", sigma_0[NORTH_P_IDX, :3])
-    print("sigma_0_south:", sigma_0[SOUTH_IDX, :3])
-    print("sigma_0_low_A:", sigma_0[LOW_A_IDX, :3])
-    print("sigma_0_low_PI:", sigma_0[LOW_PI_IDX, :3])
-    print("sigma_0_deep:", sigma_0[DEEP_IDX, :3])
+    # Per-box outputs are indexed by box first, so a single index array pulls out all six boxes at once
+    for name, values in (('T', T), ('S', S), ('sigma_0', sigma_0)):
+        for label, row in zip(BOX_LABELS, values[BOX_IDX, :3]):
+            print(f"{name}_{label}:", row)
 
-    print("Plotting results...")
-    plt.plot(M_n_A, label='M_n_A')
-    plt.plot(M_n_P, label='M_n_P')
-    plt.plot(M_upw_A, label='M_upw_A')
-    plt.plot(M_upw_PI, label='M_upw_PI')
-    plt.plot(M_eddy_A, label='M_eddy_A')
-    plt.plot(M_eddy_PI, label='M_eddy_PI')
-    plt.plot(D_low_A, label='Dlow_A')
-    plt.plot(D_low_PI, label='D_low_PI')
-    plt.legend()
-    plt.title("1D Box Model Outputs")
-
-    fig, ax = plt.subplots(nrows=2, ncols=3)
-    ax[0, 0].plot(T[NORTH_A_IDX], label='North_A')
-    ax[0, 1].plot(T[NORTH_P_IDX], label='North_P')
-    ax[0, 2].plot(T[SOUTH_IDX], label='South')
-    ax[1, 0].plot(T[LOW_A_IDX], label='Low_A')
-    ax[1, 1].plot(T[LOW_PI_IDX], label='Low_PI')
-    ax[1, 2].plot(T[DEEP_IDX], label='Deep')
-    ax[0, 0].legend(), ax[0, 1].legend(), ax[0, 2].legend()
-    ax[1, 0].legend(), ax[1, 1].legend(), ax[1, 2].legend()
-    plt.suptitle("Temperature in the 6 different boxes")
-    plt.tight_layout()
-
-    fig1, ax1 = plt.subplots(nrows=2, ncols=3)
-    ax1[0, 0].plot(S[NORTH_A_IDX], label='North_A')
-    ax1[0, 1].plot(S[NORTH_P_IDX], label='North_P')
-    ax1[0, 2].plot(S[SOUTH_IDX], label='South')
-    ax1[1, 0].plot(S[LOW_A_IDX], label='Low_A')
-    ax1[1, 1].plot(S[LOW_PI_IDX], label='Low_PI')
-    ax1[1, 2].plot(S[DEEP_IDX], label='Deep')
-    ax1[0, 0].legend(), ax1[0, 1].legend(), ax1[0, 2].legend()
-    ax1[1, 0].legend(), ax1[1, 1].legend(), ax1[1, 2].legend()
-    plt.suptitle("Salinity in the 6 different boxes")
-    plt.tight_layout()
-
-    fig2, ax2 = plt.subplots(nrows=2, ncols=3)
-    ax2[0, 0].plot(sigma_0[NORTH_A_IDX], label='North_A')
-    ax2[0, 1].plot(sigma_0[NORTH_P_IDX], label='North_P')
-    ax2[0, 2].plot(sigma_0[SOUTH_IDX], label='South')
-    ax2[1, 0].plot(sigma_0[LOW_A_IDX], label='Low_A')
-    ax2[1, 1].plot(sigma_0[LOW_PI_IDX], label='Low_PI')
-    ax2[1, 2].plot(sigma_0[DEEP_IDX], label='Deep')
-    ax2[0, 0].legend(), ax2[0, 1].legend(), ax2[0, 2].legend()
-    ax2[1, 0].legend(), ax2[1, 1].legend(), ax2[1, 2].legend()
-    plt.suptitle("Density in the 6 different boxes")
-    plt.tight_layout()
-    plt.show(block=False)
+    if not no_plot:
+        plot_results(M_n_A, M_n_P, M_upw_A, M_upw_PI, M_eddy_A, M_eddy_PI, D_low_A, D_low_PI, T, S, sigma_0)
 
     # Consider an example of some data collection
     Fwn_A_values_to_test = [10000, 50000, 100000, 500000, 1000000]
@@ -239,25 +280,40 @@ def main():
 
     # Collect the data... (should take a few seconds)
     print(f"Generating data for alternate parameter settings: T_north={alternate_north_atl_starting_temp}")
-    start_time = time.time()
+    print(f"Fwn_A values: {Fwn_A_values_to_test}")
+    start_time = time.perf_counter_ns()
     results = []
     for fwn in Fwn_A_values_to_test:
-        print(f"Fwn_A={fwn}")
         params.Fwn_A = fwn
         results.append(six_box_model(box_dims, init, params, time_step, rand))
-    time_to_collect_data = time.time() - start_time
-    print(f"Total time to collect data: {time_to_collect_data} seconds")
+    time_to_collect_data_ns = time.perf_counter_ns() - start_time
+    print(f"Total time to collect data: {time_to_collect_data_ns / 1e9:.3f} seconds")
+
+    # Optionally save the collected data to disk for later analysis; reload it with `np.load`
+    if save_path is not None:
+        saved_path = save_sweep_results(save_path, Fwn_A_values_to_test, results)
+        print(f"Saved sweep results to {saved_path}")
 
     # Let's look at the difference in M_n_A for each run
-    print("Plotting results...")
-    plt.figure()
-    for i in range(len(Fwn_A_values_to_test)):
-        plt.plot(results[i].M_n_A, label=f"Fwn_A={Fwn_A_values_to_test[i]}")
-    plt.title(f"M_n_A for different Northern Fluxes and T_north_A0={alternate_north_atl_starting_temp}")
-    plt.legend()
-    plt.show()  # suspends script until plot windows are closed
+    if not no_plot:
+        print("Plotting results...")
+        plt.figure()
+        M_n_A_sweep = np.column_stack([result.M_n_A for result in results])
+        plt.plot(M_n_A_sweep, label=[f"Fwn_A={fwn}" for fwn in Fwn_A_values_to_test])
+        plt.title(f"M_n_A for different Northern Fluxes and T_north_A0={alternate_north_atl_starting_temp}")
+        plt.legend()
+        plt.show()  # suspends script until plot windows are closed
     print("Done")
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="PyBAMOCS six-box model tutorial")
+    parser.add_argument('--no-plot', action='store_true', help="Skip all plotting, e.g., when benchmarking the model")
+    parser.add_argument('--backend', default=None, help="Matplotlib backend to use, e.g., 'Agg'")
+    parser.add_argument('--save', default=None, metavar='PATH', help="Save the Fwn_A sweep outputs to this .npz file")
+    if hasattr(builtins, '__IPYTHON__'):
+        # IPython/Jupyter passes its own arguments (e.g., `-f kernel.json`) to the script, so ignore unknown ones there
+        args, _ = parser.parse_known_args()
+    else:
+        args = parser.parse_args()
+    main(no_plot=args.no_plot, backend=args.backend, save_path=args.save)